@@ -10,6 +10,7 @@ from datetime import datetime
 from config import BINANCE_WS_ENDPOINT, BINANCE_SNAPSHOT_ENDPOINT
 from const import LAST_UPDATED_TS, BINANCE, BIDS, ASKS
 from exchanges.ws_client import WSClient
+from profiling import traced
 
 
 class BinanceWS(WSClient):
@@ -38,6 +39,7 @@ class BinanceWS(WSClient):
         """
         return f"{BINANCE_WS_ENDPOINT}/ws/{base_asset.lower()}{quote_asset.lower()}@depth@100ms"
 
+    @traced("Binance._on_message")
     def _on_message(self, wsapi, message) -> None:
         """
         How to manage a local order book correctly
@@ -74,6 +76,7 @@ class BinanceWS(WSClient):
             else:
                 self._logger.error(f"Binance Order Book out of sync...")
 
+    @traced("Binance.process_updates")
     def process_updates(self, data: Dict[Any, Any]) -> None:
         """
         Apply bids and asks updates. Update last updated timestamp
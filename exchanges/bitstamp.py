@@ -9,6 +9,7 @@ from datetime import datetime
 from config import BITSTAMP_ENDPOINT
 from const import LAST_UPDATED_TS, BITSTAMP, BIDS, ASKS
 from exchanges.ws_client import WSClient
+from profiling import traced
 
 
 class BitstampWS(WSClient):
@@ -48,6 +49,7 @@ class BitstampWS(WSClient):
         # Send the initial subscription payload
         self._ws.send(self._subscription_payload())
 
+    @traced("Bitstamp._on_message")
     def _on_message(self, wsapi, message) -> None:
         """
         Bitstamp only supports order book snapshots. Thus, we take the payload and overwrite
@@ -0,0 +1,223 @@
+import os
+import sys
+import signal
+import logging
+import functools
+import threading
+
+from time import perf_counter, sleep
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class Tracer:
+    def __init__(self):
+        """
+        Collects timing spans around hot-path calls. While disabled, spans are
+        reduced to a single attribute check, so the instrumentation can stay in place.
+        """
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._stats: Dict[str, List[float]] = {}
+
+    def toggle(self) -> bool:
+        """
+        Flip tracing on/off. Stats are reset when tracing is switched on.
+        """
+        if not self.enabled:
+            self.reset()
+        self.enabled = not self.enabled
+        return self.enabled
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = {}
+
+    def span(self, name: str):
+        """
+        Context manager timing the enclosed block under the given name
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name)
+
+    def record(self, name: str, elapsed: float) -> None:
+        """
+        Aggregate the span as [count, total, max] to keep the recording cheap
+        """
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                self._stats[name] = [1, elapsed, elapsed]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed
+                if elapsed > stats[2]:
+                    stats[2] = elapsed
+
+    def summary(self) -> List[Tuple[str, int, float, float]]:
+        """
+        Return (name, count, total seconds, max seconds) per span, slowest total first
+        """
+        with self._lock:
+            rows = [(name, int(count), total, max_) for name, (count, total, max_) in self._stats.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def format_summary(self) -> str:
+        lines = [f"{'span':<32}{'count':>10}{'avg (us)':>12}{'max (us)':>12}{'total (ms)':>12}"]
+        for name, count, total, max_ in self.summary():
+            lines.append(f"{name:<32}{count:>10}{total / count * 1e6:>12.1f}{max_ * 1e6:>12.1f}{total * 1e3:>12.2f}")
+        return "\n".join(lines)
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_start")
+
+    def __init__(self, tracer: Tracer, name: str):
+        self._tracer = tracer
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._tracer.record(self._name, perf_counter() - self._start)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+# Process-wide tracer shared by the exchange feeds and the RPC servicer
+tracer = Tracer()
+
+
+def traced(name: str) -> Callable:
+    """
+    Decorator recording a span around each call of the wrapped function
+    """
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                tracer.record(name, perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class SamplingProfiler(threading.Thread):
+    def __init__(self, duration: float, interval: float, output_dir: str, logger: logging.Logger):
+        """
+        Statistical profiler for the live process. Samples the stacks of all
+        threads every `interval` seconds for `duration` seconds and writes a report.
+        :param duration: profiling window in seconds
+        :param interval: sampling interval in seconds
+        :param output_dir: directory the report is written to
+        :param logger: logging object
+        """
+        super().__init__(name="SamplingProfiler", daemon=True)
+
+        self._duration = duration
+        self._interval = interval
+        self._output_dir = output_dir
+        self._logger = logger
+        self.samples = 0
+        self.self_counts: Dict[Tuple[str, int, str], int] = {}
+        self.cum_counts: Dict[Tuple[str, int, str], int] = {}
+        self.report_path: Optional[str] = None
+
+    def sample(self) -> None:
+        """
+        Take one sample of every thread except the profiler itself
+        """
+        own_id = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            self.samples += 1
+
+            # Leaf frame gets the self sample
+            code = frame.f_code
+            key = (code.co_filename, code.co_firstlineno, code.co_name)
+            self.self_counts[key] = self.self_counts.get(key, 0) + 1
+
+            # Every function on the stack gets one cumulative sample (once, even if recursive)
+            seen = set()
+            while frame is not None:
+                code = frame.f_code
+                key = (code.co_filename, code.co_firstlineno, code.co_name)
+                if key not in seen:
+                    seen.add(key)
+                    self.cum_counts[key] = self.cum_counts.get(key, 0) + 1
+                frame = frame.f_back
+
+    def format_report(self, limit: int = 40) -> str:
+        lines = [f"Sampled {self.samples} thread stacks over {self._duration}s "
+                 f"(interval {self._interval * 1e3:.1f}ms)", "",
+                 f"{'self %':>8}{'cum %':>8}  function"]
+        total = self.samples or 1
+        top = sorted(self.cum_counts.items(), key=lambda item: (self.self_counts.get(item[0], 0), item[1]),
+                     reverse=True)
+        for (filename, lineno, name), cum in top[:limit]:
+            own = self.self_counts.get((filename, lineno, name), 0)
+            lines.append(f"{own / total * 100:>8.2f}{cum / total * 100:>8.2f}  {name} ({filename}:{lineno})")
+        return "\n".join(lines)
+
+    def run(self):
+        end = perf_counter() + self._duration
+        while perf_counter() < end:
+            self.sample()
+            sleep(self._interval)
+
+        os.makedirs(self._output_dir, exist_ok=True)
+        self.report_path = os.path.join(self._output_dir, f"profile_{datetime.now():%Y%m%d_%H%M%S}.txt")
+        with open(self.report_path, "w") as f:
+            f.write(self.format_report() + "\n")
+        self._logger.warning(f"Profile written to {self.report_path}")
+
+
+def install_signal_handlers(logger: logging.Logger, profile_seconds: float, profile_interval: float,
+                            profile_dir: str) -> None:
+    """
+    SIGUSR1 toggles hot-path tracing; switching it off logs the collected spans.
+    SIGUSR2 runs the sampling profiler for `profile_seconds` in the running process.
+    """
+    if not hasattr(signal, "SIGUSR1"):
+        logger.warning("Profiling signals are not supported on this platform")
+        return
+
+    profiler: List[Optional[SamplingProfiler]] = [None]
+
+    def _toggle_tracing(signum, frame):
+        if tracer.toggle():
+            logger.warning("Tracing enabled")
+        else:
+            logger.warning(f"Tracing disabled\n{tracer.format_summary()}")
+
+    def _start_profiler(signum, frame):
+        if profiler[0] is not None and profiler[0].is_alive():
+            logger.warning("Profiler already running...")
+            return
+        logger.warning(f"Profiling for {profile_seconds}s...")
+        profiler[0] = SamplingProfiler(duration=profile_seconds, interval=profile_interval,
+                                       output_dir=profile_dir, logger=logger)
+        profiler[0].start()
+
+    signal.signal(signal.SIGUSR1, _toggle_tracing)
+    signal.signal(signal.SIGUSR2, _start_profiler)
@@ -7,6 +7,7 @@ from threading import Lock
 from order_book import OrderBook
 from decimal import Decimal
 from typing import List
+from profiling import traced, tracer, install_signal_handlers
 
 import logging
 import click
@@ -28,6 +29,7 @@ class OrderbookAggregatorServicer(keyrock_ob_aggregator_pb2_grpc.OrderbookAggreg
         # Initialize orderbook
         self.orderbook = orderbook
 
+    @traced("parse_ob")
     def parse_ob(self, exchange: str, side: str) -> List[keyrock_ob_aggregator_pb2.Level]:
         """
         Convert the order book side into a list of gRPC objects.
@@ -43,6 +45,7 @@ class OrderbookAggregatorServicer(keyrock_ob_aggregator_pb2_grpc.OrderbookAggreg
                 ob.append(keyrock_ob_aggregator_pb2.Level(exchange=exchange, price=p, amount=a))
         return ob
 
+    @traced("get_agg_ob")
     def get_agg_ob(self) -> keyrock_ob_aggregator_pb2.Summary:
         """
         Get the top bid&ask levels per exchange. Then merge
@@ -69,7 +72,11 @@ class OrderbookAggregatorServicer(keyrock_ob_aggregator_pb2_grpc.OrderbookAggreg
         while True:
             if self.orderbook[LAST_UPDATED_TS] > self._last_transmission:
                 self._last_transmission = datetime.now()
-                yield self.get_agg_ob()
+                summary = self.get_agg_ob()
+
+                # The generator resumes once gRPC has serialized and sent the message
+                with tracer.span("BookSummary.send"):
+                    yield summary
 
 
 @click.command()
@@ -78,10 +85,17 @@ class OrderbookAggregatorServicer(keyrock_ob_aggregator_pb2_grpc.OrderbookAggreg
 @click.option('--levels', type=int, default=10)
 @click.option('--dust_amount', type=float, default=0)
 @click.option('--port', type=int, default=50052)
-def main(base_asset, quote_asset, levels, dust_amount, port):
+@click.option('--profile_seconds', type=float, default=10)
+@click.option('--profile_interval', type=float, default=0.005)
+@click.option('--profile_dir', type=str, default='profiles')
+def main(base_asset, quote_asset, levels, dust_amount, port, profile_seconds, profile_interval, profile_dir):
     # Initialize logging
     logger = logging.getLogger("Order book Aggregator")
 
+    # SIGUSR1 toggles tracing, SIGUSR2 profiles the running process
+    install_signal_handlers(logger=logger, profile_seconds=profile_seconds, profile_interval=profile_interval,
+                            profile_dir=profile_dir)
+
     logger.info(f"Initializing service...")
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
 
@@ -0,0 +1,89 @@
+import logging
+import sys
+import pytest
+import threading
+
+sys.path.append('../keyrock_ob_aggregator')
+
+from profiling import Tracer, SamplingProfiler, traced, tracer
+
+
+@pytest.fixture
+def global_tracer():
+    tracer.enabled = False
+    tracer.reset()
+    yield tracer
+    tracer.enabled = False
+    tracer.reset()
+
+
+def test_span_disabled():
+    """
+    Spans are not recorded while tracing is off
+    """
+    t = Tracer()
+    with t.span("test"):
+        pass
+    assert t.summary() == []
+
+
+def test_span_enabled():
+    """
+    Test toggling tracing and span aggregation
+    """
+    t = Tracer()
+    assert t.toggle() is True
+    for _ in range(3):
+        with t.span("test"):
+            pass
+
+    name, count, total, max_ = t.summary()[0]
+    assert name == "test"
+    assert count == 3
+    assert total >= max_ >= 0
+
+    assert t.toggle() is False
+    assert "test" in t.format_summary()
+
+
+def test_traced_decorator(global_tracer):
+    """
+    Decorated functions are only timed while the global tracer is enabled
+    """
+    @traced("add")
+    def add(a, b):
+        return a + b
+
+    assert add(1, 2) == 3
+    assert global_tracer.summary() == []
+
+    global_tracer.toggle()
+    assert add(1, 2) == 3
+    assert global_tracer.summary()[0][:2] == ("add", 1)
+
+
+def test_sampling_profiler(tmp_path):
+    """
+    Test the profiler samples other threads and writes the report
+    """
+    stop = threading.Event()
+
+    def busy_worker():
+        while not stop.is_set():
+            sum(range(1000))
+
+    worker = threading.Thread(target=busy_worker)
+    worker.start()
+    try:
+        profiler = SamplingProfiler(duration=0.05, interval=0.001, output_dir=str(tmp_path),
+                                    logger=logging.getLogger("Test Logger"))
+        profiler.start()
+        profiler.join()
+    finally:
+        stop.set()
+        worker.join()
+
+    assert profiler.samples > 0
+    assert any(name == "busy_worker" for _, _, name in profiler.cum_counts)
+    with open(profiler.report_path) as f:
+        assert "busy_worker" in f.read()